@@ -1,10 +1,63 @@
 from enum import IntEnum
-from typing import Any, Optional
+from functools import lru_cache
+from typing import Any, List, Optional
 
 from docutils.statemachine import StringList
 from sphinx.application import Sphinx
 from sphinx.ext.autodoc import ClassDocumenter, bool_option
 
+_ATTRIBUTES_RUBRIC = ".. rubric:: Attributes"
+_COMMANDS_RUBRIC = ".. rubric:: Commands"
+_INCLUDED_IN_RUBRIC = ".. rubric:: Included in"
+
+
+@lru_cache(maxsize=None)
+def _extract_members(clss):
+    """Return ``(name, member, metaclass name)`` for the documented members."""
+    members = []
+    for name in dir(clss):
+        if name.startswith("_") or name == "is_active":
+            continue
+        member = getattr(clss, name)
+        members.append((name, member, member.__class__.__name__))
+    return tuple(members)
+
+
+def _summary(member) -> str:
+    """Return the first line of a member's docstring."""
+    return (member.__doc__ or "").partition("\n")[0]
+
+
+@lru_cache(maxsize=256)
+def _pretty(attr: str) -> str:
+    """Return the display form of a property attribute name."""
+    return attr.replace("_", " ")
+
+
+class _Node:
+    """Tables collected for one class in the documented object tree."""
+
+    __slots__ = (
+        "parent",
+        "path",
+        "obj",
+        "attr",
+        "cmd",
+        "include",
+        "key_max",
+        "val_max",
+    )
+
+    def __init__(self, parent, path, obj):
+        self.parent = parent
+        self.path = path
+        self.obj = obj
+        self.attr = {"Member": "Summary"}
+        self.cmd = {"Command": "Summary"}
+        self.include = {"Parent": "Summary"}
+        self.key_max = 0
+        self.val_max = 0
+
 
 class PostDocumenter(ClassDocumenter):
     objtype = "postdoc"
@@ -17,198 +70,159 @@ class PostDocumenter(ClassDocumenter):
     def can_document_member(
         cls, member: Any, membername: str, isattr: bool, parent: Any
     ) -> bool:
-        try:
-            return issubclass(member, IntEnum)
-        except TypeError:
-            return False
+        return isinstance(member, type) and issubclass(member, IntEnum)
 
     def add_directive_header(self, sig: str) -> None:
-        self.add_line(f".. _post_{self.object.__name__}:", self.get_sourcename())
-        self.add_line("   ", self.get_sourcename())
+        source_name = self.get_sourcename()
+        self.add_line(f".. _post_{self.object.__name__}:", source_name)
+        self.add_line("   ", source_name)
         super().add_directive_header(sig)
-        self.add_line("   ", self.get_sourcename())
+        self.add_line("   ", source_name)
+
+    def _add_lines(self, lines: List[str], source_name: str) -> None:
+        """Append lines to the directive result with a single list extension.
+
+        Produces the same result as calling ``add_line`` for each line.
+        """
+        self.directive.result.extend(
+            StringList(
+                [self.indent + line if line.strip() else "" for line in lines],
+                items=[(source_name, 0)] * len(lines),
+            )
+        )
 
     def add_content(self, more_content: Optional[StringList]) -> None:
         super().add_content(more_content)
 
         source_name = self.get_sourcename()
         object = self.object
-        self.add_line("", source_name)
 
         data_dicts = {}
+        walked = set()
+
+        def _add_row(node, rows, key, value):
+            if len(rows) == 1:
+                # The header row is only emitted once the table has data.
+                ((header_key, header_value),) = rows.items()
+                node.key_max = max(node.key_max, len(header_key))
+                node.val_max = max(node.val_max, len(header_value))
+            rows[key] = value
+            node.key_max = max(node.key_max, len(key))
+            node.val_max = max(node.val_max, len(value))
 
         def _update(clss, obj_name, parent_name=None, parent_path=None):
             if not data_dicts.get(obj_name):
-                data_dicts[obj_name] = {}
-                data_dicts[obj_name]["parent"] = parent_name
-                data_dicts[obj_name]["path"] = (
-                    parent_path + "_" + obj_name if parent_path else obj_name
+                data_dicts[obj_name] = _Node(
+                    parent_name,
+                    parent_path + "_" + obj_name if parent_path else obj_name,
+                    clss,
                 )
-                data_dicts[obj_name]["obj"] = clss
-                data_dicts[obj_name]["attr"] = {"Member": "Summary"}
-                data_dicts[obj_name]["cmd"] = {"Command": "Summary"}
-                data_dicts[obj_name]["include"] = {"Parent": "Summary"}
             dic = data_dicts[obj_name]
             if parent_path:
-                dic["include"][
-                    f":ref:`{parent_name} <post_{parent_path}>`"
-                ] = f"{parent_name}'s child"
-
-            for the_member_name in dir(clss):
-                if the_member_name.startswith("_") or the_member_name == "is_active":
-                    continue
-                cls = getattr(clss, the_member_name)
-                the_member_value = (cls.__doc__ or "").split("\n")[0]
-                if cls.__class__.__name__ in (
-                    "PyLocalPropertyMeta",
-                    "PyLocalObjectMeta",
-                ):
-                    if cls.__class__.__name__ == "PyLocalObjectMeta":
-                        dic["attr"][
-                            f":ref:`{the_member_name} <post_{dic['path']}_{the_member_name}>`"  # noqa: E501
-                        ] = the_member_value
-                    else:
-                        dic["attr"][the_member_name] = the_member_value
-                        attrs = getattr(cls, "attributes", None)
-                        if attrs:
-                            for attr in attrs:
-                                dic["attr"][
-                                    f"{the_member_name}.{attr}"
-                                ] = f"``{the_member_name}`` {' '.join(attr.split('_'))}."  # noqa: E501
-
+                _add_row(
+                    dic,
+                    dic.include,
+                    f":ref:`{parent_name} <post_{parent_path}>`",
+                    f"{parent_name}'s child",
+                )
+            # Members of a class are the same wherever it appears in the tree.
+            if (clss, obj_name) in walked:
+                return
+            walked.add((clss, obj_name))
+
+            children = []
+            for the_member_name, cls, meta_name in _extract_members(clss):
+                if meta_name == "PyLocalObjectMeta":
+                    _add_row(
+                        dic,
+                        dic.attr,
+                        f":ref:`{the_member_name} <post_{dic.path}_{the_member_name}>`",  # noqa: E501
+                        _summary(cls),
+                    )
+                    children.append((the_member_name, cls))
+                elif meta_name == "PyLocalPropertyMeta":
+                    _add_row(dic, dic.attr, the_member_name, _summary(cls))
+                    attrs = getattr(cls, "attributes", None)
+                    if attrs:
+                        for attr in attrs:
+                            _add_row(
+                                dic,
+                                dic.attr,
+                                f"{the_member_name}.{attr}",
+                                f"``{the_member_name}`` {_pretty(attr)}.",
+                            )
                 elif callable(cls):
-                    dic["cmd"][the_member_name] = the_member_value
-
-            for name in dir(clss):
-                if name == "is_active":
-                    continue
-                cls = getattr(clss, name)
-                if cls.__class__.__name__ in ("PyLocalObjectMeta",):
-                    _update(cls, name, obj_name, data_dicts[obj_name]["path"])
+                    _add_row(dic, dic.cmd, the_member_name, _summary(cls))
+
+            for name, cls in children:
+                _update(cls, name, obj_name, dic.path)
             for base_class in clss.__bases__:
                 _update(base_class, obj_name, parent_name)
 
         _update(object, object.__name__)
-        key_max = 0
-        val_max = 0
-        for obj_name, obj_dic in data_dicts.items():
-            o = obj_dic["obj"]
-            parent = obj_dic["parent"]
-            for item in ["attr", "cmd", "include"]:
-                dic = obj_dic[item]
-                if len(dic) > 1:
-                    key_max = max(key_max, len(max(dic.keys(), key=len)))
-                    val_max = max(val_max, len(max(dic.values(), key=len)))
+        key_max = max(obj_dic.key_max for obj_dic in data_dicts.values())
+        if not key_max:
+            # Only placeholder header rows were collected, nothing to tabulate.
+            self.add_line("", source_name)
+            return
+        val_max = max(obj_dic.val_max for obj_dic in data_dicts.values())
+        col_gap = 3
+        key_width = key_max + col_gap
+        border = f'{"="*key_max}{" "*col_gap}{"="*val_max}'
 
+        lines = [""]
         for obj_name, obj_dic in data_dicts.items():
-            o = obj_dic["obj"]
-            parent = obj_dic["parent"]
-            dic = obj_dic["attr"]
+            if not obj_dic.key_max:
+                lines.append("")
+                continue
+            o = obj_dic.obj
+            parent = obj_dic.parent
+            dic = obj_dic.attr
             if len(dic) > 1:
-                col_gap = 3
-                total = key_max + val_max + col_gap
                 # Top border
                 if o != object:
-                    self.add_line(f".. _post_{obj_dic['path']}:", source_name)
-                    self.add_line("", source_name)
-                    self.add_line(
-                        f".. rubric:: {o.__module__}.{o.__qualname__}", source_name
-                    )
-                    self.add_line("", source_name)
-                    # self.add_line(
-                    #    f".. autoclass:: {o.__module__}.{o.__qualname__}", source_name
-                    # )
-                self.add_line(f".. rubric:: Attributes", source_name)
-                self.add_line("", source_name)
-                self.add_line(f'{"="*key_max}{" "*col_gap}{"="*val_max}', source_name)
-                header = True
-                for key, value in dic.items():
-                    if header:
-                        # Write header and border
-                        self.add_line(
-                            f'{key}{" "*(total-len(key)-len(value))}{value}',
-                            source_name,
-                        )
-                        self.add_line(
-                            f'{"="*key_max}{" "*col_gap}{"="*val_max}', source_name
-                        )
-                        header = False
-                    else:
-                        # actual data
-                        self.add_line(
-                            f'{key}{" "*(total-len(key)-len(value))}{value}',
-                            source_name,
-                        )
+                    lines += [
+                        f".. _post_{obj_dic.path}:",
+                        "",
+                        f".. rubric:: {o.__module__}.{o.__qualname__}",
+                        "",
+                    ]
+                    # lines.append(f".. autoclass:: {o.__module__}.{o.__qualname__}")
+                lines += [_ATTRIBUTES_RUBRIC, "", border]
+                rows = [
+                    key.ljust(key_width) + value.rjust(val_max)
+                    for key, value in dic.items()
+                ]
+                # Write header and border, then the actual data
+                lines += [rows[0], border, *rows[1:]]
                 # Bottom border
-                self.add_line(f'{"="*key_max}{" "*col_gap}{"="*val_max}', source_name)
-                self.add_line("", source_name)
+                lines += [border, ""]
 
-            dic = obj_dic["cmd"]
+            dic = obj_dic.cmd
             if "update" in dic:
                 del dic["update"]
             if len(dic) > 1:
-                col_gap = 3
-                total = key_max + val_max + col_gap
-
-                self.add_line(f".. rubric:: Commands", source_name)
-                self.add_line("", source_name)
-                self.add_line(f'{"="*key_max}{" "*col_gap}{"="*val_max}', source_name)
-                header = True
-                for key, value in dic.items():
-                    if header:
-                        # Write header and border
-                        self.add_line(
-                            f'{key}{" "*(total-len(key)-len(value))}{value}',
-                            source_name,
-                        )
-                        self.add_line(
-                            f'{"="*key_max}{" "*col_gap}{"="*val_max}', source_name
-                        )
-                        header = False
-                    else:
-                        # actual data
-                        self.add_line(
-                            f'{key}{" "*(total-len(key)-len(value))}{value}',
-                            source_name,
-                        )
+                lines += [_COMMANDS_RUBRIC, "", border]
+                rows = [
+                    key.ljust(key_width) + value.rjust(val_max)
+                    for key, value in dic.items()
+                ]
+                lines += [rows[0], border, *rows[1:]]
                 # Bottom border
-                self.add_line("", source_name)
-                self.add_line(f'{"="*key_max}{" "*col_gap}{"="*val_max}', source_name)
-                self.add_line("", source_name)
-                self.add_line("", source_name)
+                lines += ["", border, "", ""]
 
             if parent:
-                dic = obj_dic["include"]
-                col_gap = 3
-                total = key_max + val_max + col_gap
-
-                self.add_line(f".. rubric:: Included in", source_name)
-                self.add_line("   ", source_name)
-                self.add_line(f'{"="*key_max}{" "*col_gap}{"="*val_max}', source_name)
-                self.add_line("   ", source_name)
-                header = True
-                for key, value in dic.items():
-                    if header:
-                        # Write header and border
-                        self.add_line(
-                            f'{key}{" "*(total-len(key)-len(value))}{value}',
-                            source_name,
-                        )
-                        self.add_line(
-                            f'{"="*key_max}{" "*col_gap}{"="*val_max}', source_name
-                        )
-                        header = False
-                    else:
-                        # actual data
-                        self.add_line(
-                            f'{key}{" "*(total-len(key)-len(value))}{value}',
-                            source_name,
-                        )
+                dic = obj_dic.include
+                lines += [_INCLUDED_IN_RUBRIC, "   ", border, "   "]
+                rows = [
+                    key.ljust(key_width) + value.rjust(val_max)
+                    for key, value in dic.items()
+                ]
+                lines += [rows[0], border, *rows[1:]]
                 # Bottom border
-                self.add_line("", source_name)
-                self.add_line(f'{"="*key_max}{" "*col_gap}{"="*val_max}', source_name)
-                self.add_line("", source_name)
-            self.add_line("", source_name)
+                lines += ["", border, ""]
+            lines.append("")
+        self._add_lines(lines, source_name)
 
 
 def setup(app: Sphinx) -> None:
@@ -11,6 +11,12 @@ is an exhaust manifold.
 # Run the following in command prompt to execute this file:
 # exec(open("script_manifold.py").read())
 
+import atexit
+import logging
+import os
+import threading
+import time
+
 import ansys.fluent.core as pyfluent
 from ansys.fluent.core import examples
 
@@ -22,12 +28,13 @@ import_data = examples.download_file(
     file_name="exhaust_system.dat.h5", directory="pyfluent/exhaust_system"
 )
 
+# Set the PYFLUENT_UI_MODE environment variable to gui to show the Fluent GUI.
 session = pyfluent.launch_fluent(
     precision="double",
     processor_count=2,
     start_transcript=False,
     mode="solver",
-    ui_mode="gui",
+    ui_mode=os.environ.get("PYFLUENT_UI_MODE", "no_gui"),
 )
 
 from ansys.fluent.visualization import set_config
@@ -41,7 +48,6 @@ from ansys.fluent.visualization.plotter import plotter_windows_manager
 
 # get the graphics objects for the session
 graphics_session1 = Graphics(session)
-graphics_session1_1 = Graphics(session)
 
 # mesh
 mesh1 = graphics_session1.Meshes["mesh-1"]
@@ -58,32 +64,26 @@ contour1 = graphics_session1.Contours["contour-1"]
 contour1.field = "velocity-magnitude"
 contour1.surfaces = ["solid_up:1:830"]
 
-
-graphics_session1.Contours["contour-2"]
-graphics_session1_1.Contours["contour-3"]
-
 # vector
-vector1 = graphics_session1_1.Vectors["vector-1"]
+vector1 = graphics_session1.Vectors["vector-1"]
 vector1.surfaces = ["solid_up:1:830"]
 vector1.scale = 4.0
 vector1.skip = 0
 vector1.field = "temperature"
-vector1.display()
 
 # iso surface
-surface1 = graphics_session1_1.Surfaces["surface-1"]
+surface1 = graphics_session1.Surfaces["surface-1"]
 surface1.definition.type = "iso-surface"
 surface1.definition.iso_surface.field = "velocity-magnitude"
 surface1.definition.iso_surface.rendering = "contour"
 surface1.definition.iso_surface.iso_value = 0.0
 
 
-local_surfaces_provider = Graphics(session).Surfaces
+local_surfaces_provider = graphics_session1.Surfaces
 matplotlib_plots1 = Plots(session, local_surfaces_provider=local_surfaces_provider)
 
 
 p1 = matplotlib_plots1.XYPlots["p1"]
-p1.surfaces = ["solid_up:1:830", "surface-1"]
 p1.surfaces = ["solid_up:1:830"]
 p1.y_axis_function = "temperature"
 p1.plot("p1")
@@ -110,22 +110,80 @@ plotter.view_isometric()
 surface1.display("surface-1")
 
 
+class RefreshQueue:
+    """Run window refreshes on a worker thread instead of the event thread.
+
+    A refresh queued again under the same key before it has run replaces
+    the pending one. Refreshes run at most ``fps`` times a second, and the
+    last one queued always runs.
+    """
+
+    def __init__(self, fps=30):
+        self._interval = 1 / fps
+        self._pending = {}
+        self._condition = threading.Condition()
+        threading.Thread(target=self._run, daemon=True).start()
+
+    def enqueue(self, key, refresh, *args):
+        with self._condition:
+            self._pending[key] = (refresh, args)
+            self._condition.notify()
+
+    def _run(self):
+        last_draw = 0.0
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._pending)
+            # Refreshes queued until the next frame is due collapse into it.
+            time.sleep(max(0.0, last_draw + self._interval - time.monotonic()))
+            last_draw = time.monotonic()
+            with self._condition:
+                pending, self._pending = self._pending, {}
+            for key, (refresh, args) in pending.items():
+                try:
+                    refresh(*args)
+                except Exception:
+                    # Keep the worker alive for the refreshes that follow.
+                    logging.exception("Refreshing %s failed.", key)
+
+
+# Fluent can finish iterations faster than the windows can be redrawn. Events
+# that arrive while a refresh is pending collapse into it, so the windows are
+# redrawn at most 30 times a second and the last iteration is always drawn.
+refresh_queue = RefreshQueue()
+
+
 def auto_refersh_call_back_iteration(session_id, event_info):
-    if event_info.index % 1 == 0:
-        graphics_windows_manager.refresh_windows(session_id, ["contour-1"])
-        plotter_windows_manager.refresh_windows(
-            session_id, ["residual", "mass-tot-rplot", "mass-bal-rplot"]
-        )
+    refresh_queue.enqueue(
+        "graphics", graphics_windows_manager.refresh_windows, session_id, ["contour-1"]
+    )
+    refresh_queue.enqueue(
+        "plots",
+        plotter_windows_manager.refresh_windows,
+        session_id,
+        ["residual", "mass-tot-rplot", "mass-bal-rplot"],
+    )
 
 
 def auto_refersh_call_back_time_step(session_id, event_info):
-    graphics_windows_manager.refresh_windows(session_id)
-    plotter_windows_manager.refresh_windows("", ["residual"])
+    refresh_queue.enqueue(
+        "all-graphics", graphics_windows_manager.refresh_windows, session_id
+    )
+    refresh_queue.enqueue(
+        "residual", plotter_windows_manager.refresh_windows, "", ["residual"]
+    )
 
 
 def initialize_call_back(session_id, event_info):
-    graphics_windows_manager.refresh_windows(session_id)
-    plotter_windows_manager.refresh_windows("", ["residual", "mass-tot-rplot"])
+    refresh_queue.enqueue(
+        "all-graphics", graphics_windows_manager.refresh_windows, session_id
+    )
+    refresh_queue.enqueue(
+        "initial-plots",
+        plotter_windows_manager.refresh_windows,
+        "",
+        ["residual", "mass-tot-rplot"],
+    )
 
 
 cb_init_id = session.events.register_callback("InitializedEvent", initialize_call_back)
@@ -136,4 +194,13 @@ cb_itr_id = session.events.register_callback(
     "IterationEndedEvent", auto_refersh_call_back_iteration
 )
 
+
+# The Fluent session may outlive Python, stop redrawing when Python exits.
+def unregister_callbacks():
+    for callback_id in (cb_init_id, cb_data_read_id, cb_itr_id):
+        session.events.unregister_callback(callback_id)
+
+
+atexit.register(unregister_callbacks)
+
 graphics_windows_manager.animate_windows(session.id, ["contour-1"])
@@ -15,27 +15,43 @@ from ansys.fluent.visualization import set_config
 
 set_config(blocking=False)
 
+import atexit
+from concurrent.futures import ThreadPoolExecutor
+import logging
+import os
+import threading
+import time
+
 import ansys.fluent.core as pyfluent
 from ansys.fluent.core import examples
 
-import_case = examples.download_file(
-    file_name="exhaust_system.cas.h5", directory="pyfluent/exhaust_system"
-)
-
-import_data = examples.download_file(
-    file_name="exhaust_system.dat.h5", directory="pyfluent/exhaust_system"
-)
-
-session = pyfluent.launch_fluent(
-    precision="double",
-    processor_count=2,
-    start_transcript=False,
-    mode="solver",
-    ui_mode="gui",
-)
-
-session.settings.file.read_case(file_name=import_case)
-session.settings.file.read_data(file_name=import_data)
+# The downloads and the Fluent launch are independent, so they run concurrently.
+# Set the PYFLUENT_UI_MODE environment variable to gui to show the Fluent GUI.
+with ThreadPoolExecutor(max_workers=3) as executor:
+    case_download = executor.submit(
+        examples.download_file,
+        file_name="exhaust_system.cas.h5",
+        directory="pyfluent/exhaust_system",
+    )
+    data_download = executor.submit(
+        examples.download_file,
+        file_name="exhaust_system.dat.h5",
+        directory="pyfluent/exhaust_system",
+    )
+    launch = executor.submit(
+        pyfluent.launch_fluent,
+        precision="double",
+        processor_count=2,
+        start_transcript=False,
+        mode="solver",
+        ui_mode=os.environ.get("PYFLUENT_UI_MODE", "no_gui"),
+    )
+    import_case = case_download.result()
+    data_download.result()
+    session = launch.result()
+
+# read_case_data picks up the data file downloaded next to the case file.
+session.settings.file.read_case_data(file_name=import_case)
 
 from ansys.fluent.visualization import (
     Contour,
@@ -47,6 +63,7 @@ from ansys.fluent.visualization import (
     Vector,
     XYPlot,
 )
+from ansys.fluent.visualization.graphics import graphics_windows_manager
 
 # mesh
 mesh1 = Mesh(solver=session, show_edges=True, surfaces=["solid_up:1:830"])
@@ -63,9 +80,6 @@ contour1 = Contour(
 vector1 = Vector(
     solver=session, surfaces=["solid_up:1:830"], scale=4.0, skip=0, field="temperature"
 )
-p_vect = GraphicsWindow()
-p_vect.add_graphics(vector1)
-p_vect.show()
 
 # iso surface
 surface1 = Surface(solver=session)
@@ -100,31 +114,79 @@ p_mbr = GraphicsWindow()
 p_mbr.add_graphics(mbr)
 p_mbr.show()
 
-p_mesh = GraphicsWindow()
-p_mesh.add_graphics(mesh1)
-p_mesh.show()
-p_vect = GraphicsWindow()
-p_vect.add_graphics(vector1)
-p_vect.show()
+# Graphics that are not refreshed by the callbacks share one window.
+p_static = GraphicsWindow(grid=(2, 2))
+p_static.add_graphics(mesh1, position=(0, 0))
+p_static.add_graphics(vector1, position=(0, 1))
+p_static.add_graphics(pathlines1, position=(1, 0))
+p_static.add_graphics(surface1, position=(1, 1))
+p_static.show()
+
 p_cont = GraphicsWindow()
 p_cont.add_graphics(contour1)
 p_cont.show()
-p_pathline = GraphicsWindow()
-p_pathline.add_graphics(pathlines1)
-p_pathline.show()
 
 p_cont.plotter.view_isometric()
 
-p_surf = GraphicsWindow()
-p_surf.add_graphics(surface1)
-p_surf.show()
+
+class RefreshQueue:
+    """Run window refreshes on a worker thread instead of the event thread.
+
+    A refresh queued again under the same key before it has run replaces
+    the pending one. Refreshes run at most ``fps`` times a second, and the
+    last one queued always runs.
+    """
+
+    def __init__(self, fps=30):
+        self._interval = 1 / fps
+        self._pending = {}
+        self._condition = threading.Condition()
+        threading.Thread(target=self._run, daemon=True).start()
+
+    def enqueue(self, key, refresh, *args):
+        with self._condition:
+            self._pending[key] = (refresh, args)
+            self._condition.notify()
+
+    def _run(self):
+        last_draw = 0.0
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._pending)
+            # Refreshes queued until the next frame is due collapse into it.
+            time.sleep(max(0.0, last_draw + self._interval - time.monotonic()))
+            last_draw = time.monotonic()
+            with self._condition:
+                pending, self._pending = self._pending, {}
+            for key, (refresh, args) in pending.items():
+                try:
+                    refresh(*args)
+                except Exception:
+                    # Keep the worker alive for the refreshes that follow.
+                    logging.exception("Refreshing %s failed.", key)
+
+
+# Redrawing on every iteration slows the solve down. Events that arrive while a
+# refresh is pending collapse into it, and the windows are redrawn at most four
+# times a second.
+refresh_queue = RefreshQueue(fps=4)
+
+iteration_windows = [
+    p_cont.window_id,
+    p_res.window_id,
+    p_mtr.window_id,
+    p_mbr.window_id,
+]
+initialize_windows = [p_res.window_id, p_mtr.window_id]
 
 
 def auto_refersh_call_back_iteration(session, event_info):
-    p_cont.refresh_windows(session.id)
-    p_res.refresh_windows(session.id)
-    p_mtr.refresh_windows(session.id)
-    p_mbr.refresh_windows(session.id)
+    refresh_queue.enqueue(
+        "iteration",
+        graphics_windows_manager.refresh_windows,
+        session.id,
+        iteration_windows,
+    )
 
 
 def auto_refersh_call_back_time_step(session, event_info):
@@ -132,8 +194,12 @@ def auto_refersh_call_back_time_step(session, event_info):
 
 
 def initialize_call_back(session, event_info):
-    p_res.refresh_windows(session.id)
-    p_mtr.refresh_windows(session.id)
+    refresh_queue.enqueue(
+        "initialize",
+        graphics_windows_manager.refresh_windows,
+        session.id,
+        initialize_windows,
+    )
 
 
 cb_init_id = session.events.register_callback("InitializedEvent", initialize_call_back)
@@ -144,4 +210,13 @@ cb_itr_id = session.events.register_callback(
     "IterationEndedEvent", auto_refersh_call_back_iteration
 )
 
+
+# The Fluent session may outlive Python, stop redrawing when Python exits.
+def unregister_callbacks():
+    for callback_id in (cb_init_id, cb_data_read_id, cb_itr_id):
+        session.events.unregister_callback(callback_id)
+
+
+atexit.register(unregister_callbacks)
+
 p_cont.animate_windows(session.id)
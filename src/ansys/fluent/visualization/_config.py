@@ -1,6 +1,10 @@
 """Global configuration state for visualization."""
 
-_global_config = {"blocking": False, "set_view_on_display": None}
+_global_config = {
+    "blocking": False,
+    "set_view_on_display": None,
+    "mesh_decimation": 0.0,
+}
 
 
 def get_config() -> dict:
@@ -17,7 +21,11 @@ def get_config() -> dict:
     return _global_config.copy()
 
 
-def set_config(blocking: bool = False, set_view_on_display: str = "isometric"):
+def set_config(
+    blocking: bool = False,
+    set_view_on_display: str = "isometric",
+    mesh_decimation: float = 0.0,
+):
     """Set visualization configuration.
 
     Parameters
@@ -27,15 +35,26 @@ def set_config(blocking: bool = False, set_view_on_display: str = "isometric"):
     set_view_on_display : str, default=None
         If specified, then graphics will always be displayed in the specified view.
         Valid values are xy, xz, yx, yz, zx, zy and isometric.
+    mesh_decimation : float, default=0.0
+        Fraction of triangles removed from mesh surfaces, and from contours of
+        node values, before they are drawn in interactive (non-blocking) windows.
+        Must be in the range ``[0, 1)``. The default of ``0.0`` draws the
+        full-resolution mesh. Saved graphics are always full resolution.
     """
     if set_view_on_display not in set_config.allowed_views:
         raise ValueError(
             f"'{set_view_on_display}' is not an allowed view.\n"
             f"Allowed views are: {set_config.allowed_views}"
         )
+    if not 0.0 <= mesh_decimation < 1.0:
+        raise ValueError(
+            f"'{mesh_decimation}' is not a valid mesh decimation.\n"
+            "Mesh decimation must be in the range [0, 1)."
+        )
 
     _global_config["blocking"] = blocking
     _global_config["set_view_on_display"] = set_view_on_display
+    _global_config["mesh_decimation"] = mesh_decimation
 
 
 set_config.allowed_views = ["xy", "xz", "yx", "yz", "zx", "zy", "isometric"]
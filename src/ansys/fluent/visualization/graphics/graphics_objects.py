@@ -3,7 +3,7 @@
 import sys
 from typing import Optional
 
-from ansys.fluent.core.post_objects.meta import Command
+from ansys.fluent.core.post_objects.meta import Command, PyLocalPropertyMeta
 from ansys.fluent.core.post_objects.post_helper import PostAPIHelper
 from ansys.fluent.core.post_objects.post_object_definitions import (
     ContourDefn,
@@ -87,9 +87,15 @@ class Pathlines(PathlinesDefn):
         pathlines1 = graphics_session.Pathlines["pathlines-1"]
         pathlines1.field = "velocity-magnitude"
         pathlines1.surfaces = ['inlet']
+        pathlines1.skip = 4
         pathlines1.display("window-0")
     """
 
+    class skip(metaclass=PyLocalPropertyMeta):
+        """Pathlines skip."""
+
+        value: int = 0
+
     @Command
     def display(self, window_id: Optional[str] = None, overlay: Optional[bool] = False):
         """Display mesh graphics.
@@ -11,6 +11,17 @@ class GraphicsWindow:
         self._graphics_objs = []
         self.window_id = None
 
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Close the window and release its renderer and fetched data."""
+        if not self.window_id:
+            return
+        graphics_windows_manager.close_window(self.window_id)
+        self.window_id = None
+        self.graphics_window = self._renderer = self.plotter = None
+
     def add_graphics(
         self,
         object,
@@ -83,7 +94,7 @@ class GraphicsWindow:
             If the window does not support the specified format.
         """
         if self.window_id:
-            self._renderer.save_graphic(f"{self.window_id}.{format}")
+            graphics_windows_manager.save_graphic(self.window_id, format)
 
     def refresh_windows(
         self,
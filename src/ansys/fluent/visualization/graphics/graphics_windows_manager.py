@@ -44,6 +44,24 @@ class FieldDataType(Enum):
 from ansys.fluent.visualization.graphics.pyvista.graphics_defns import Renderer
 
 
+def _same_monitor_data(old, new) -> bool:
+    """Return whether two fetches of a monitor set returned the same data."""
+    if old is None or new is None:
+        return False
+    (old_name, old_indices, old_columns), (name, indices, columns) = old, new
+    return (
+        old_name == name
+        and np.array_equal(old_indices, indices)
+        and old_columns.keys() == columns.keys()
+        and all(np.array_equal(old_columns[key], columns[key]) for key in columns)
+    )
+
+
+def _decimate(mesh: pv.PolyData, target_reduction: float) -> pv.PolyData:
+    """Return a coarser copy of the mesh that keeps its point data."""
+    return mesh.triangulate().decimate_pro(target_reduction, preserve_topology=True)
+
+
 class GraphicsWindow(PostWindow):
     """Provides for managing Graphics windows."""
 
@@ -71,6 +89,12 @@ class GraphicsWindow(PostWindow):
         self.update: bool = False
         self._visible: bool = False
         self._data = {}
+        self._meshes = {}
+        self._mesh_surfaces = None
+        self._layers = []
+        self._full_resolution: bool = False
+        self._monitor_revision = None
+        self._refreshing: bool = False
         self._subplot = None
         self._opacity = None
 
@@ -80,6 +104,7 @@ class GraphicsWindow(PostWindow):
 
     def fetch(self):
         """Fetch data for graphics."""
+        self._monitor_revision = None
         if not self.post_object:
             return
         obj = self.post_object
@@ -111,6 +136,10 @@ class GraphicsWindow(PostWindow):
 
         if not self.overlay:
             self.renderer._clear_plotter(in_notebook())
+            self._layers.clear()
+        if self._mesh_decimation():
+            # Kept only to redraw decimated meshes at full resolution on save.
+            self._layers.append((obj, dict(self._data), position, opacity))
         if obj.__class__.__name__ == "Mesh":
             self._display_mesh(obj, position, opacity)
         elif obj.__class__.__name__ == "Surface":
@@ -140,15 +169,110 @@ class GraphicsWindow(PostWindow):
             self.renderer.show()
             self._visible = True
 
+    def save_graphic(self, file_name: str):
+        """Save graphics to the specified file.
+
+        Decimated meshes are drawn again at full resolution for the export.
+
+        Parameters
+        ----------
+        file_name : str
+            File name to save graphic.
+        """
+        # Hold the lock the refresh callback draws under so that a refresh
+        # cannot run in between the full resolution redraw and the export.
+        with GraphicsWindowsManager._condition:
+            if not self._mesh_decimation():
+                self.renderer.save_graphic(file_name)
+                return
+            self._full_resolution = True
+            try:
+                self._redraw_layers()
+                self.renderer.save_graphic(file_name)
+            finally:
+                self._full_resolution = False
+                self._redraw_layers()
+
     def plot(self):
         """Display graphics."""
+        refreshing, self._refreshing = self._refreshing, False
+        monitor_revision = self._monitor_revision
         self.fetch()
+        if (
+            refreshing
+            and self._visible
+            and not self.animate
+            and _same_monitor_data(monitor_revision, self._monitor_revision)
+        ):
+            # The monitor data has not changed since it was last drawn.
+            return
         self.render()
 
     # private methods
+    def _mesh_decimation(self) -> float:
+        config = get_config()
+        if config["blocking"] or self._full_resolution:
+            return 0
+        return config["mesh_decimation"]
+
+    def _redraw_layers(self):
+        # Draw every object of the window again from the data it was drawn with.
+        state = (
+            self.post_object,
+            self._data,
+            self.overlay,
+            self.animate,
+            self._subplot,
+            self._opacity,
+        )
+        layers, self._layers = self._layers, []
+        self.renderer._clear_plotter(in_notebook())
+        self.overlay, self.animate = True, False
+        self._subplot = self._opacity = None
+        try:
+            for obj, data, position, opacity in layers:
+                self.post_object, self._data = obj, data
+                self._render_graphics(position, opacity)
+        finally:
+            self._layers = layers
+            (
+                self.post_object,
+                self._data,
+                self.overlay,
+                self.animate,
+                self._subplot,
+                self._opacity,
+            ) = state
+
     def _fetch_data(self, obj, data_type: FieldDataType):
         if self._data.get(data_type) is None or self.fetch_data:
-            self._data[data_type] = FieldDataExtractor(obj).fetch_data()
+            mesh_surfaces = (
+                (obj._api_helper.id(), tuple(obj.surfaces()))
+                if data_type == FieldDataType.Meshes
+                else None
+            )
+            if (
+                mesh_surfaces
+                and self.overlay
+                and self._data.get(data_type) is not None
+                and mesh_surfaces == self._mesh_surfaces
+            ):
+                # Meshes on the same surfaces only differ in how they are drawn,
+                # the window still holds the data fetched for the previous one.
+                return
+            data = FieldDataExtractor(obj).fetch_data()
+            # Field values are only color mapped, single precision is enough.
+            # Vertices keep their precision.
+            for surface_data in data.values():
+                for name, values in surface_data.items():
+                    if (
+                        name != "vertices"
+                        and getattr(values, "dtype", None) == np.float64
+                    ):
+                        surface_data[name] = values.astype(np.float32)
+            self._data[data_type] = data
+            if mesh_surfaces:
+                self._mesh_surfaces = mesh_surfaces
 
     def _fetch_or_display_surface(self, obj, fetch: bool, position=[0, 0], opacity=1):
         dummy_object = "dummy_object"
@@ -192,11 +316,12 @@ class GraphicsWindow(PostWindow):
 
     def _fetch_monitor_data(self, obj):
         monitors = obj._api_helper.monitors
-        indices, columns_data = monitors.get_monitor_set_data(obj.monitor_set_name())
+        monitor_set_name = obj.monitor_set_name()
+        indices, columns_data = monitors.get_monitor_set_data(monitor_set_name)
+        self._monitor_revision = (monitor_set_name, indices, columns_data)
         xy_data = {}
         for column_name, column_data in columns_data.items():
             xy_data[column_name] = {"xvalues": indices, "yvalues": column_data}
-        monitor_set_name = obj.monitor_set_name()
         self._data["MonitorPlot"] = xy_data
         self._data["MonitorPlot"]["properties"] = {
             "curves": list(xy_data.keys()),
@@ -206,18 +331,44 @@ class GraphicsWindow(PostWindow):
             "yscale": "log" if monitor_set_name == "residual" else "linear",
         }
 
-    def _resolve_mesh_data(self, mesh_data):
-        topology = "line" if mesh_data["faces"][0] == 2 else "face"
+    def _resolve_mesh_data(self, mesh_data, key=None, decimation=0):
+        vertices = mesh_data["vertices"]
+        faces = mesh_data["faces"]
+        if decimation and key:
+            return self._resolve_decimated_mesh(mesh_data, key, decimation)
+        cached = self._meshes.get(key) if key else None
+        if cached and cached[0] is vertices and cached[1] is faces:
+            # Refresh without new data, reuse the geometry built last time.
+            return cached[2].copy(deep=False)
+        topology = "line" if faces[0] == 2 else "face"
         if topology == "line":
-            return pv.PolyData(
-                mesh_data["vertices"],
-                lines=mesh_data["faces"],
-            )
+            mesh = pv.PolyData(vertices, lines=faces)
         else:
-            return pv.PolyData(
-                mesh_data["vertices"],
-                faces=mesh_data["faces"],
-            )
+            mesh = pv.PolyData(vertices, faces=faces)
+        if not key:
+            return mesh
+        self._meshes[key] = (vertices, faces, mesh)
+        # Callers attach per-render arrays, keep the cached geometry bare.
+        return mesh.copy(deep=False)
+
+    def _resolve_decimated_mesh(self, mesh_data, key, decimation):
+        # The returned mesh carries the indices of the points it kept from the
+        # full resolution mesh, for the caller to pick node values with.
+        vertices = mesh_data["vertices"]
+        faces = mesh_data["faces"]
+        decimated_key = (*key, decimation)
+        cached = self._meshes.get(decimated_key)
+        if cached and cached[0] is vertices and cached[1] is faces:
+            return cached[2].copy(deep=False)
+        mesh = self._resolve_mesh_data(mesh_data, key)
+        if not mesh.faces.size:
+            # Line meshes are left as they are.
+            mesh = mesh.copy(deep=False)
+        else:
+            mesh.point_data["point_ids"] = np.arange(mesh.n_points)
+            mesh = _decimate(mesh, decimation)
+        self._meshes[decimated_key] = (vertices, faces, mesh)
+        return mesh.copy(deep=False)
 
     def _display_vector(self, obj, position=(0, 0), opacity=1):
         field_info = obj._api_helper.field_info()
@@ -238,7 +389,9 @@ class GraphicsWindow(PostWindow):
                 3,
             )
             vector_scale = mesh_data["vector-scale"][0]
-            mesh = self._resolve_mesh_data(mesh_data)
+            mesh = self._resolve_mesh_data(
+                mesh_data, (FieldDataType.Vectors, surface_id)
+            )
             mesh.cell_data["vectors"] = mesh_data[vectors_of]
             scalar_field = mesh_data[obj.field()]
             velocity_magnitude = np.linalg.norm(mesh_data[vectors_of], axis=1)
@@ -296,6 +449,7 @@ class GraphicsWindow(PostWindow):
         scalar_bar_args = self.renderer._scalar_bar_default_properties()
 
         # loop over all meshes
+        meshes = []
         for surface_id, surface_data in self._data[FieldDataType.Pathlines].items():
             if "vertices" not in surface_data or "lines" not in surface_data:
                 continue
@@ -307,13 +461,17 @@ class GraphicsWindow(PostWindow):
             )
 
             mesh.point_data[field] = surface_data[obj.field()]
-            self.renderer.render(
-                mesh,
-                scalars=field,
-                scalar_bar_args=scalar_bar_args,
-                position=position,
-                opacity=opacity,
-            )
+            meshes.append(mesh)
+        if not meshes:
+            return
+        # Pathlines from all surfaces are drawn as one actor.
+        self.renderer.render(
+            meshes[0].append_polydata(*meshes[1:]) if len(meshes) > 1 else meshes[0],
+            scalars=field,
+            scalar_bar_args=scalar_bar_args,
+            position=position,
+            opacity=opacity,
+        )
 
     def _display_contour(self, obj, position=(0, 0), opacity=1):
         # contour properties
@@ -324,6 +482,7 @@ class GraphicsWindow(PostWindow):
         filled = obj.filled()
         contour_lines = obj.contour_lines()
         node_values = obj.node_values()
+        decimation = self._mesh_decimation()
 
         # scalar bar properties
         scalar_bar_args = self.renderer._scalar_bar_default_properties()
@@ -333,9 +492,17 @@ class GraphicsWindow(PostWindow):
             if "vertices" not in surface_data or "faces" not in surface_data:
                 continue
             surface_data["vertices"].shape = surface_data["vertices"].size // 3, 3
-            mesh = self._resolve_mesh_data(surface_data)
+            # Only node values survive decimation, cell values would be lost.
+            mesh = self._resolve_mesh_data(
+                surface_data,
+                (FieldDataType.Contours, surface_id),
+                decimation if node_values else 0,
+            )
             if node_values:
-                mesh.point_data[field] = surface_data[obj.field()]
+                values = surface_data[obj.field()]
+                if "point_ids" in mesh.point_data:
+                    values = values[mesh.point_data.pop("point_ids")]
+                mesh.point_data[field] = values
             else:
                 mesh.cell_data[field] = surface_data[obj.field()]
             if range_option == "auto-range-off":
@@ -441,30 +608,45 @@ class GraphicsWindow(PostWindow):
         )
 
     def _display_mesh(self, obj, position=(0, 0), opacity=1):
+        decimation = self._mesh_decimation()
+        colors = list(self.renderer._colors.values())
+        meshes = []
         for surface_id, mesh_data in self._data[FieldDataType.Meshes].items():
             if "vertices" not in mesh_data or "faces" not in mesh_data:
                 continue
             mesh_data["vertices"].shape = mesh_data["vertices"].size // 3, 3
-            mesh = self._resolve_mesh_data(mesh_data)
-            color_size = len(self.renderer._colors)
-            color = list(self.renderer._colors.values())[surface_id % color_size]
-            self.renderer.render(
-                mesh,
-                show_edges=obj.show_edges(),
-                color=color,
-                position=position,
-                opacity=opacity,
+            # Coarser geometry keeps interactive windows responsive.
+            mesh = self._resolve_mesh_data(
+                mesh_data, (FieldDataType.Meshes, surface_id), decimation
             )
+            mesh.point_data.pop("point_ids", None)
+            mesh.cell_data["colors"] = np.tile(
+                np.array(colors[surface_id % len(colors)], dtype=np.uint8),
+                (mesh.n_cells, 1),
+            )
+            meshes.append(mesh)
+        if not meshes:
+            return
+        # Draw all surfaces as one actor, each keeping its own color.
+        self.renderer.render(
+            meshes[0].append_polydata(*meshes[1:]) if len(meshes) > 1 else meshes[0],
+            scalars="colors",
+            rgb=True,
+            show_edges=obj.show_edges(),
+            position=position,
+            opacity=opacity,
+        )
 
     def _display_xy_plot(self, position=(0, 0), opacity=1):
+        # The renderer consumes the plot properties, keep them for a redraw.
         self.renderer.render(
-            self._data["XYPlot"],
+            dict(self._data["XYPlot"]),
             position=position,
         )
 
     def _display_monitor_plot(self, position=(0, 0), opacity=1):
         self.renderer.render(
-            self._data["MonitorPlot"],
+            dict(self._data["MonitorPlot"]),
             position=position,
         )
 
@@ -705,7 +887,7 @@ class GraphicsWindowsManager(PostWindowsManager, metaclass=AbstractSingletonMeta
         with self._condition:
             window = self._post_windows.get(window_id)
             if window:
-                window.renderer.save_graphic(f"{window_id}.{format}")
+                window.save_graphic(f"{window_id}.{format}")
 
     def refresh_windows(
         self,
@@ -733,6 +915,7 @@ class GraphicsWindowsManager(PostWindowsManager, metaclass=AbstractSingletonMeta
                 window = self._post_windows.get(window_id)
                 if window:
                     window.refresh = True
+                    window._refreshing = True
                     self.plot(window.post_object, window.id, overlay=overlay)
 
     def animate_windows(
@@ -791,6 +974,27 @@ class GraphicsWindowsManager(PostWindowsManager, metaclass=AbstractSingletonMeta
                         window.renderer.plotter.close()
                     window.close = True
 
+    def close_window(self, window_id: str) -> None:
+        """Close a window and release its renderer and fetched data.
+
+        Parameters
+        ----------
+        window_id : str
+            ID of the window to close.
+        """
+        with self._condition:
+            window = self._post_windows.pop(window_id, None)
+            if not window:
+                return
+            window.close = True
+            window._data.clear()
+            window._meshes.clear()
+            window._layers.clear()
+            if in_notebook() or get_config()["blocking"]:
+                # Otherwise the plotter thread owns the plotter and closes it.
+                window.renderer.plotter.close()
+                window.renderer.plotter.deep_clean()
+
     # private methods
 
     def _display(self, grid=(1, 1)) -> None:
@@ -113,8 +113,8 @@ class Renderer(AbstractRenderer):
             min_y_value = max_y_value = min_x_value = max_x_value = None
             for count, curve in enumerate(mesh):
                 chart.line(
-                    mesh[curve]["xvalues"].tolist(),
-                    mesh[curve]["yvalues"].tolist(),
+                    mesh[curve]["xvalues"],
+                    mesh[curve]["yvalues"],
                     width=2.5,
                     color=color_list[count % len(color_list)],
                     style=style_list[count % len(style_list)],
@@ -56,6 +56,8 @@ class Plotter(AbstractPlotter):
         self._visible = False
         self._remote_process = remote_process
         self.fig = None
+        self._axes = {}
+        self._lines = {}
 
     @staticmethod
     def _compute_position(position: tuple) -> int:
@@ -87,31 +89,47 @@ class Plotter(AbstractPlotter):
             max_y_value = np.amax(data[curve]["yvalues"])
             min_x_value = np.amin(data[curve]["xvalues"])
             max_x_value = np.amax(data[curve]["xvalues"])
-            self._data[curve]["xvalues"] = data[curve]["xvalues"].tolist()
-            self._data[curve]["yvalues"] = data[curve]["yvalues"].tolist()
+            self._data[curve]["xvalues"] = np.asarray(data[curve]["xvalues"])
+            self._data[curve]["yvalues"] = np.asarray(data[curve]["yvalues"])
             self._min_y = min(self._min_y, min_y_value) if self._min_y else min_y_value
             self._max_y = max(self._max_y, max_y_value) if self._max_y else max_y_value
             self._min_x = min(self._min_x, min_x_value) if self._min_x else min_x_value
             self._max_x = max(self._max_x, max_x_value) if self._max_x else max_x_value
 
         if not self._remote_process:
-            self.fig = plt.figure(num=self._window_id)
+            fig = plt.figure(num=self._window_id)
+            if fig is not self.fig:
+                self._axes.clear()
+                self._lines.clear()
+            self.fig = fig
 
-        self.ax = self.fig.add_subplot(
-            grid[0], grid[1], self._compute_position(position) + 1
-        )
+        # Refreshes update the existing axes and lines instead of stacking
+        # a new subplot with new lines on top of the previous ones.
+        subplot = (tuple(grid), self._compute_position(position) + 1)
+        self.ax = self._axes.get(subplot)
+        if self.ax is None:
+            self.ax = self.fig.add_subplot(grid[0], grid[1], subplot[1])
+            self._axes[subplot] = self.ax
         if self._yscale:
             self.ax.set_yscale(self._yscale)
         self.fig.canvas.manager.set_window_title("PyFluent [" + self._window_id + "]")
-        plt.title(self._title)
-        plt.xlabel(self._xlabel)
-        plt.ylabel(self._ylabel)
-        for curve in self._curves:
-            self.ax.plot(self._data[curve]["xvalues"], self._data[curve]["yvalues"])
-        plt.legend(labels=self._curves, loc="upper right")
+        self.ax.set_title(self._title)
+        self.ax.set_xlabel(self._xlabel)
+        self.ax.set_ylabel(self._ylabel)
+        for (ax, curve), line in self._lines.items():
+            if ax is self.ax and curve not in self._curves:
+                line.set_data([], [])
+        lines = [self._get_line(curve) for curve in self._curves]
+        for curve, line in zip(self._curves, lines):
+            line.set_data(self._data[curve]["xvalues"], self._data[curve]["yvalues"])
+        self.ax.legend(lines, self._curves, loc="upper right")
 
         if self._max_x > self._min_x:
             self.ax.set_xlim(self._min_x, self._max_x)
+        else:
+            # set_data does not update the data limits of the axes.
+            self.ax.relim()
+            self.ax.autoscale_view()
         y_range = self._max_y - self._min_y
         if self._yscale == "log":
             y_range = 0
@@ -174,6 +192,13 @@ class Plotter(AbstractPlotter):
         self._visible = False
 
     # private methods
+    def _get_line(self, curve: str):
+        line = self._lines.get((self.ax, curve))
+        if line is None:
+            (line,) = self.ax.plot([], [], label=curve)
+            self._lines[(self.ax, curve)] = line
+        return line
+
     def _reset(self):
         for curve_name in self._curves:
             self._data[curve_name] = {}
@@ -183,7 +208,7 @@ class Plotter(AbstractPlotter):
             return
         plt.figure(self.fig.number)
         for curve_name in self._curves:
-            self.ax.plot([], [], label=curve_name)
+            self._get_line(curve_name).set_data([], [])
 
 
 class ProcessPlotter(Plotter):
@@ -249,6 +274,7 @@ class ProcessPlotter(Plotter):
         self.pipe = pipe
         self.fig = plt.figure(num=self._window_id)
         self.ax = self.fig.add_subplot(111)
+        self._axes[((1, 1), 1)] = self.ax
         self._reset()
         timer = self.fig.canvas.new_timer(interval=10)
         timer.add_callback(self._call_back)
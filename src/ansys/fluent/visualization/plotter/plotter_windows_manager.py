@@ -197,13 +197,11 @@ class _MonitorPlot:
         if not self.post_object:
             return
         monitors = self.post_object._api_helper.monitors
-        indices, columns_data = monitors.get_monitor_set_data(
-            self.post_object.monitor_set_name()
-        )
+        monitor_set_name = self.post_object.monitor_set_name()
+        indices, columns_data = monitors.get_monitor_set_data(monitor_set_name)
         xy_data = {}
         for column_name, column_data in columns_data.items():
             xy_data[column_name] = {"xvalues": indices, "yvalues": column_data}
-        monitor_set_name = self.post_object.monitor_set_name()
         properties = {
             "curves": list(xy_data.keys()),
             "title": monitor_set_name,
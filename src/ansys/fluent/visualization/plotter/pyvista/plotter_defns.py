@@ -72,8 +72,8 @@ class Plotter(AbstractPlotter):
             max_y_value = np.amax(data[curve]["yvalues"])
             min_x_value = np.amin(data[curve]["xvalues"])
             max_x_value = np.amax(data[curve]["xvalues"])
-            self._data[curve]["xvalues"] = data[curve]["xvalues"].tolist()
-            self._data[curve]["yvalues"] = data[curve]["yvalues"].tolist()
+            self._data[curve]["xvalues"] = np.asarray(data[curve]["xvalues"])
+            self._data[curve]["yvalues"] = np.asarray(data[curve]["yvalues"])
             self._min_y = min(self._min_y, min_y_value) if self._min_y else min_y_value
             self._max_y = max(self._max_y, max_y_value) if self._max_y else max_y_value
             self._min_x = min(self._min_x, min_x_value) if self._min_x else min_x_value
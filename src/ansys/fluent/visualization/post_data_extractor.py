@@ -195,7 +195,9 @@ class FieldDataExtractor:
             for surf in map(obj._api_helper.remote_surface_name, obj.surfaces())
             for id in surfaces_info[surf]["surface_id"]
         ]
-        transaction.add_pathlines_fields_request(surfaces=surface_ids, field_name=field)
+        transaction.add_pathlines_fields_request(
+            surfaces=surface_ids, field_name=field, skip=obj.skip()
+        )
 
         try:
             fields = transaction.get_fields()
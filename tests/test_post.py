@@ -1,12 +1,21 @@
+import importlib
 from pathlib import Path
 import pickle
 from typing import Dict, List, Optional, Union
+from unittest.mock import MagicMock
 
 from ansys.fluent.core.services.field_data import SurfaceDataType
 import numpy as np
 import pytest
 
-from ansys.fluent.visualization import Graphics, Plots, get_config, set_config
+import ansys.fluent.visualization as pyviz
+from ansys.fluent.visualization import Graphics, Mesh, Plots, get_config, set_config
+from ansys.fluent.visualization._config import _global_config
+from ansys.fluent.visualization.graphics.graphics_windows import GraphicsWindow
+from ansys.fluent.visualization.plotter.matplotlib.plotter_defns import (
+    Plotter as MatplotlibPlotter,
+)
+from ansys.fluent.visualization.post_data_extractor import FieldDataExtractor
 
 
 @pytest.fixture(autouse=True)
@@ -24,7 +33,8 @@ class MockFieldTransaction:
 
     def add_surfaces_request(
         self,
-        surface_ids: List[int],
+        surfaces: List[int],
+        data_types: Optional[List[SurfaceDataType]] = None,
         overset_mesh: bool = False,
         provide_vertices=True,
         provide_faces=True,
@@ -33,7 +43,7 @@ class MockFieldTransaction:
     ) -> None:
         self.fields_request["surf"].append(
             (
-                surface_ids,
+                surfaces,
                 overset_mesh,
                 provide_vertices,
                 provide_faces,
@@ -44,25 +54,40 @@ class MockFieldTransaction:
 
     def add_scalar_fields_request(
         self,
-        surface_ids: List[int],
+        surfaces: List[int],
         field_name: str,
         node_value: Optional[bool] = True,
         boundary_value: Optional[bool] = False,
     ) -> None:
         self.fields_request["scalar"].append(
-            (surface_ids, field_name, node_value, boundary_value)
+            (surfaces, field_name, node_value, boundary_value)
         )
 
     def add_vector_fields_request(
         self,
-        surface_ids: List[int],
+        surfaces: List[int],
+        field_name: str,
+    ) -> None:
+        self.fields_request["vector"].append((surfaces, field_name))
+
+    def add_pathlines_fields_request(
+        self,
+        surfaces: List[int],
         field_name: str,
+        skip: Optional[int] = 0,
     ) -> None:
-        self.fields_request["vector"].append((surface_ids, field_name))
+        self.fields_request["pathlines"].append((surfaces, field_name, skip))
 
     def get_fields(self) -> Dict[int, Dict]:
         fields = {}
         for request_type, requests in self.fields_request.items():
+            if request_type == "pathlines":
+                for surf_ids, field_name, _ in requests:
+                    fields[(("type", "pathlines-field"), ("field", field_name))] = {
+                        surf_id: self.service["fields"][0][surf_id]
+                        for surf_id in surf_ids
+                    }
+                continue
             for request in requests:
                 if request_type == "surf":
                     tag_id = 0
@@ -88,7 +113,12 @@ class MockFieldTransaction:
 class MockFieldData:
     def __init__(self, solver_data, field_info):
         self._session_data = solver_data
-        self._request_to_serve = {"surf": [], "scalar": [], "vector": []}
+        self._request_to_serve = {
+            "surf": [],
+            "scalar": [],
+            "vector": [],
+            "pathlines": [],
+        }
         self._field_info = field_info
 
     def new_transaction(self):
@@ -177,6 +207,45 @@ class MockAPIHelper:
             MockAPIHelper._session_data, self.field_info
         )
         self.id = lambda: 1
+        self.remote_surface_name = lambda name: name
+        self.get_field_unit = lambda field: ""
+
+
+class MockRenderer:
+    """Record what a graphics window draws instead of opening a plotter."""
+
+    def __init__(self, win_id, in_notebook, non_interactive, grid=(1, 1)):
+        self._colors = {"red": [255, 0, 0], "lime": [0, 255, 0], "blue": [0, 0, 255]}
+        self.plotter = MagicMock(_closed=False)
+        self.rendered = []
+        self.saved = {}
+
+    def _clear_plotter(self, in_notebook):
+        self.rendered.clear()
+
+    def _set_camera(self, view):
+        pass
+
+    def _scalar_bar_default_properties(self):
+        return {}
+
+    def show(self):
+        pass
+
+    def render(self, mesh, **kwargs):
+        self.rendered.append((mesh, kwargs))
+
+    def save_graphic(self, file_name):
+        self.saved[file_name] = [mesh for mesh, _ in self.rendered]
+
+
+@pytest.fixture
+def graphics_windows(mocker):
+    module = importlib.import_module(
+        "ansys.fluent.visualization.graphics.graphics_windows_manager"
+    )
+    mocker.patch.object(module, "Renderer", MockRenderer)
+    return module
 
 
 def test_field_api():
@@ -387,6 +456,22 @@ def test_vector_object():
     )
 
 
+def test_pathlines_skip(mocker):
+    pyvista_graphics = Graphics(session=None, post_api_helper=MockAPIHelper)
+    pathlines1 = pyvista_graphics.Pathlines["pathlines-1"]
+    pathlines1.field = "temperature"
+    pathlines1.surfaces = ["wall"]
+    assert pathlines1.skip() == 0
+
+    pathlines1.skip = 4
+    request = mocker.spy(MockFieldTransaction, "add_pathlines_fields_request")
+    pathlines_data = FieldDataExtractor(pathlines1).fetch_data()
+
+    field_info = pathlines1._api_helper.field_info()
+    assert request.call_args.kwargs["skip"] == 4
+    assert list(pathlines_data) == field_info.get_surfaces_info()["wall"]["surface_id"]
+
+
 def test_surface_object():
     pyvista_graphics = Graphics(session=None)
     surf1 = pyvista_graphics.Surfaces["surf-1"]
@@ -488,6 +573,36 @@ def test_xyplot_object():
         p1.y_axis_function = "field_does_not_exist"
 
 
+def test_matplotlib_plot_reuses_lines():
+    plotter = MatplotlibPlotter("plot-window")
+    plotter.set_properties({"curves": ["a", "b"]})
+    data = {
+        "a": {"xvalues": [1, 2, 3], "yvalues": [1.0, 2.0, 3.0]},
+        "b": {"xvalues": [1, 2, 3], "yvalues": [3.0, 2.0, 1.0]},
+    }
+    try:
+        plotter.plot(data, position=(0, 0), show=False)
+        lines = list(plotter.ax.lines)
+        plotter.plot(data, position=(0, 0), show=False)
+        assert list(plotter.ax.lines) == lines and len(lines) == 2
+        np.testing.assert_array_equal(lines[0].get_ydata(), [1.0, 2.0, 3.0])
+    finally:
+        plotter.close()
+
+
+def test_matplotlib_plot_single_sample():
+    plotter = MatplotlibPlotter("plot-window")
+    plotter.set_properties({"curves": ["a"]})
+    try:
+        plotter.plot(
+            {"a": {"xvalues": [5], "yvalues": [2.0]}}, position=(0, 0), show=False
+        )
+        x_min, x_max = plotter.ax.get_xlim()
+        assert x_min < 5 < x_max
+    finally:
+        plotter.close()
+
+
 def test_get_set_config():
     # The module level variable 'INTERACTIVE' is given preference
     assert get_config()["blocking"]
@@ -497,6 +612,10 @@ def test_get_set_config():
 
     assert get_config()["blocking"]
     assert get_config()["set_view_on_display"] == "isometric"
+    assert get_config()["mesh_decimation"] == 0.0
+
+    with pytest.raises(ValueError):
+        set_config(mesh_decimation=1.0)
 
     with pytest.raises(ValueError):
         set_config(blocking=True, set_view_on_display="front")
@@ -510,3 +629,201 @@ def test_get_set_config():
         "zy",
         "isometric",
     }
+
+
+def test_mesh_decimation(graphics_windows, monkeypatch):
+    monkeypatch.setattr(pyviz, "INTERACTIVE", True)
+    monkeypatch.setitem(_global_config, "mesh_decimation", 0.75)
+    mesh1 = Graphics(session=None, post_api_helper=MockAPIHelper).Meshes["mesh-1"]
+    mesh1.surfaces = ["wall"]
+    window = graphics_windows.GraphicsWindow("window-1", mesh1)
+    window.plot()
+
+    ((decimated, _),) = window.renderer.rendered
+    window.save_graphic("window-1.svg")
+    (saved,) = window.renderer.saved["window-1.svg"]
+    assert decimated.n_cells < saved.n_cells / 2
+
+    # The window goes back to the decimated mesh after saving.
+    ((redrawn, _),) = window.renderer.rendered
+    assert redrawn.n_cells == decimated.n_cells
+    assert len(window._layers) == 1
+
+    # Without decimation nothing is kept for a full resolution redraw.
+    monkeypatch.setitem(_global_config, "mesh_decimation", 0)
+    window.plot()
+    assert not window._layers
+
+
+def test_contour_node_values_decimation(graphics_windows, monkeypatch):
+    monkeypatch.setattr(pyviz, "INTERACTIVE", True)
+    monkeypatch.setitem(_global_config, "mesh_decimation", 0.75)
+    graphics = Graphics(session=None, post_api_helper=MockAPIHelper)
+    contour = graphics.Contours["contour-decimated"]
+    contour.field = "temperature"
+    contour.surfaces = ["wall"]
+    contour.node_values = True
+    window = graphics_windows.GraphicsWindow("window-1", contour)
+    window.plot()
+
+    (decimated, _), *_ = window.renderer.rendered
+    contours_data = window._data[graphics_windows.FieldDataType.Contours]
+    ((surface_id, surface_data),) = contours_data.items()
+    full_key = (graphics_windows.FieldDataType.Contours, surface_id)
+    full = window._meshes[full_key][2]
+    assert decimated.n_cells < full.n_cells / 2
+    assert decimated.n_points == decimated["temperature"].size
+    assert "point_ids" not in decimated.point_data
+    # Kept points carry the node values of the same points at full resolution.
+    point_ids = window._meshes[(*full_key, 0.75)][2]["point_ids"]
+    np.testing.assert_array_equal(
+        decimated["temperature"], surface_data["temperature"][point_ids]
+    )
+    np.testing.assert_array_equal(decimated.points, full.points[point_ids])
+
+    # A refresh with the same data reuses the decimated geometry.
+    cached = window._meshes[(*full_key, 0.75)][2]
+    window.plot()
+    (redrawn, _), *_ = window.renderer.rendered
+    assert window._meshes[(*full_key, 0.75)][2] is cached
+    assert np.shares_memory(redrawn.points, cached.points)
+
+
+def test_graphics_window_context_manager(graphics_windows):
+    Graphics(session=None, post_api_helper=MockAPIHelper)
+    mesh1 = Mesh(solver=None, surfaces=["wall"])
+    with GraphicsWindow() as window:
+        window.add_graphics(mesh1)
+        window.show()
+        window_id = window.window_id
+        graphics_window = window.graphics_window
+        assert graphics_window._data and graphics_window._meshes
+
+    assert window.window_id is None
+    assert window_id not in graphics_windows.graphics_windows_manager._post_windows
+    assert not graphics_window._data and not graphics_window._meshes
+    graphics_window.renderer.plotter.close.assert_called_once()
+
+
+def test_mesh_surfaces_colors(graphics_windows):
+    mesh1 = Graphics(session=None, post_api_helper=MockAPIHelper).Meshes["mesh-1"]
+    mesh1.surfaces = ["wall"]
+    window = graphics_windows.GraphicsWindow("window-1", mesh1)
+    window.fetch()
+    # Add a second surface, shifted copy of the first one.
+    meshes_data = window._data[graphics_windows.FieldDataType.Meshes]
+    (surface_id,) = meshes_data
+    surface_data = meshes_data[surface_id]
+    meshes_data[surface_id + 1] = {
+        "vertices": surface_data["vertices"] + 1.0,
+        "faces": surface_data["faces"],
+    }
+    window.render()
+
+    ((mesh, kwargs),) = window.renderer.rendered
+    assert kwargs["scalars"] == "colors" and kwargs["rgb"]
+    colors = list(window.renderer._colors.values())
+    n_cells = mesh.n_cells // 2
+    np.testing.assert_array_equal(
+        mesh.cell_data["colors"][:n_cells], [colors[surface_id % len(colors)]] * n_cells
+    )
+    np.testing.assert_array_equal(
+        mesh.cell_data["colors"][n_cells:],
+        [colors[(surface_id + 1) % len(colors)]] * n_cells,
+    )
+
+
+def test_mesh_geometry_cache(graphics_windows):
+    mesh1 = Graphics(session=None, post_api_helper=MockAPIHelper).Meshes["mesh-1"]
+    mesh1.surfaces = ["wall"]
+    window = graphics_windows.GraphicsWindow("window-1", mesh1)
+    window.plot()
+    ((first, _),) = window.renderer.rendered
+    (key,) = window._meshes
+    cached = window._meshes[key][2]
+
+    # Re-rendering the same data reuses the geometry through a copy.
+    window.plot()
+    ((second, _),) = window.renderer.rendered
+    assert window._meshes[key][2] is cached
+    assert second is not cached and second is not first
+    assert np.shares_memory(second.points, cached.points)
+    assert "colors" in second.cell_data and "colors" not in cached.cell_data
+
+
+def test_graphics_window_same_mesh_surfaces(graphics_windows, mocker):
+    Graphics(session=None, post_api_helper=MockAPIHelper)
+    mesh1 = Mesh(solver=None, surfaces=["wall"], show_edges=True)
+    mesh2 = Mesh(solver=None, surfaces=["wall"])
+    fetch_data = mocker.spy(FieldDataExtractor, "fetch_data")
+    with GraphicsWindow(grid=(1, 2)) as window:
+        window.add_graphics(mesh1, position=(0, 0))
+        window.add_graphics(mesh2, position=(0, 1))
+        window.show()
+        rendered = window.graphics_window.renderer.rendered
+
+    assert fetch_data.call_count == 1
+    assert [kwargs["position"] for _, kwargs in rendered] == [(0, 0), (0, 1)]
+
+
+def test_overlaid_mesh_same_surfaces_fetched_once(graphics_windows, mocker):
+    graphics = Graphics(session=None, post_api_helper=MockAPIHelper)
+    mesh1, mesh2 = graphics.Meshes["mesh-1"], graphics.Meshes["mesh-2"]
+    mesh1.surfaces = mesh2.surfaces = ["wall"]
+    window = graphics_windows.GraphicsWindow("window-1", mesh1)
+    window.fetch_data = True
+    fetch_data = mocker.spy(FieldDataExtractor, "fetch_data")
+    window.fetch()
+    assert fetch_data.call_count == 1
+
+    window.post_object, window.overlay = mesh2, True
+    window.fetch()
+    assert fetch_data.call_count == 1
+
+    # Without overlay the window is drawn afresh from new data.
+    window.overlay = False
+    window.fetch()
+    assert fetch_data.call_count == 2
+
+
+class MockMonitors:
+    def __init__(self, indices, columns_data):
+        self.data = indices, columns_data
+
+    def get_monitor_set_data(self, monitor_set_name):
+        return self.data
+
+    def get_monitor_set_names(self):
+        return ["residual"]
+
+    def get_monitor_set_prop(self, monitor_set_name, prop):
+        return prop
+
+
+def test_monitor_refresh_skips_unchanged_data(graphics_windows, mocker, monkeypatch):
+    manager = graphics_windows.graphics_windows_manager
+    monitors = MockMonitors(np.arange(1, 4), {"continuity": np.array([1.0, 0.5, 0.2])})
+    monkeypatch.setattr(MockAPIHelper, "monitors", monitors, raising=False)
+    monitor_plot = Plots(session=None, post_api_helper=MockAPIHelper).Monitors["m-1"]
+    monitor_plot.monitor_set_name = "residual"
+    window = graphics_windows.GraphicsWindow("monitor-window", monitor_plot)
+    manager._post_windows[window.id] = window
+    render = mocker.spy(type(window), "render")
+    try:
+        window.plot()
+        assert render.call_count == 1
+
+        # A refresh without new samples does not redraw.
+        manager.refresh_windows(windows_id=[window.id])
+        assert render.call_count == 1
+
+        # An explicit display always redraws.
+        manager.plot(monitor_plot, window.id)
+        assert render.call_count == 2
+
+        # Same samples count and last index, different values (re-initialized).
+        monitors.data = np.arange(1, 4), {"continuity": np.array([1.0, 0.6, 0.3])}
+        manager.refresh_windows(windows_id=[window.id])
+        assert render.call_count == 3
+    finally:
+        manager.close_window(window.id)